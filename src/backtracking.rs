@@ -1,84 +1,105 @@
 use crate::*;
-use std::collections::{HashMap, HashSet};
+
+/// Every path found for one pair, stored back to back in a single buffer so
+/// that recording a path is a copy into shared storage rather than a new Vec.
+#[derive(Default)]
+struct PathSet {
+    points: Vec<Point>,
+    ends: Vec<usize>,
+}
+
+impl PathSet {
+    fn push(&mut self, path: &[Point]) {
+        self.points.extend_from_slice(path);
+        self.ends.push(self.points.len());
+    }
+
+    fn iter(&self) -> impl Iterator<Item = &[Point]> {
+        let mut start = 0;
+        self.ends.iter().map(move |&end| {
+            let path = &self.points[start..end];
+            start = end;
+            path
+        })
+    }
+}
 
 fn find_paths(
     grid: &Grid,
     current: Point,
     end: Point,
     colour: Colour,
-    visited: &mut HashSet<Point>,
+    visited: &mut CellSet,
     path: &mut Vec<Point>,
-) -> Vec<Vec<Point>> {
+    found: &mut PathSet,
+) {
     if current == end {
-        return vec![path.clone()];
+        found.push(path);
+        return;
     }
 
-    let mut results = vec![];
-    visited.insert(current);
+    visited.insert(grid.index(current));
 
     for neighbour in current.neighbors(grid.width, grid.height) {
-        if visited.contains(&neighbour) {
+        if visited.contains(grid.index(neighbour)) {
             continue;
         }
 
         match grid.get(neighbour) {
             Cell::Empty => {
                 path.push(neighbour);
-                let subpaths = find_paths(grid, neighbour, end, colour, visited, path);
-                results.extend(subpaths);
+                find_paths(grid, neighbour, end, colour, visited, path, found);
                 path.pop();
             }
             Cell::Path { colour: c, solved } if c == colour => {
                 // Skip already solved cells to avoid overwriting guaranteed solutions
                 if !solved {
                     path.push(neighbour);
-                    let subpaths = find_paths(grid, neighbour, end, colour, visited, path);
-                    results.extend(subpaths);
+                    find_paths(grid, neighbour, end, colour, visited, path, found);
                     path.pop();
                 }
             }
             Cell::Endpoint { colour: c, .. } if c == colour => {
                 path.push(neighbour);
-                let subpaths = find_paths(grid, neighbour, end, colour, visited, path);
-                results.extend(subpaths);
+                find_paths(grid, neighbour, end, colour, visited, path, found);
                 path.pop();
             }
             _ => {}
         }
     }
 
-    visited.remove(&current);
-    results
+    visited.remove(grid.index(current));
 }
 
 pub fn brute_force(grid: &mut Grid) -> bool {
-    let endpoints = grid.get_endpoints();
-    grid.fill_guaranteed(&endpoints);
-    println!("{}", grid);
-
-    let pairs: Vec<(Colour, Point, Point)> =
-        endpoints.iter().map(|(&c, &(s, e))| (c, s, e)).collect();
+    let pairs = grid.endpoint_pairs().to_vec();
+    grid.fill_guaranteed(&pairs);
 
     fn backtrack(
         grid: &mut Grid,
         pairs: &[(Colour, Point, Point)],
         index: usize,
-        endpoints: &HashMap<Colour, (Point, Point)>,
+        visited: &mut CellSet,
+        scratch: &mut Vec<Point>,
     ) -> bool {
         if index == pairs.len() {
-            return grid.is_solved(endpoints);
+            // Connectivity has to be rechecked here: a candidate path can run
+            // through cells that `fill_guaranteed` gave to another colour
+            // after the candidates were collected, and painting skips those
+            // cells, leaving the colour split.
+            return grid.is_solved();
         }
 
         let (colour, start, end) = pairs[index];
 
         if grid.connected(colour, start, end) {
-            return backtrack(grid, pairs, index + 1, endpoints);
+            return backtrack(grid, pairs, index + 1, visited, scratch);
         }
 
-        let mut visited = HashSet::new();
-        let mut path = vec![];
-
-        let all_paths = find_paths(grid, start, end, colour, &mut visited, &mut path);
+        // find_paths leaves `visited` and `scratch` empty again when it
+        // returns, so one pair of buffers serves every level of the search.
+        let mut all_paths = PathSet::default();
+        find_paths(grid, start, end, colour, visited, scratch, &mut all_paths);
 
         for path in all_paths.iter() {
             for &p in path {
@@ -87,9 +108,9 @@ pub fn brute_force(grid: &mut Grid) -> bool {
                 }
             }
 
-            grid.fill_guaranteed(endpoints);
+            grid.fill_guaranteed(pairs);
 
-            if backtrack(grid, pairs, index + 1, endpoints) {
+            if backtrack(grid, pairs, index + 1, visited, scratch) {
                 return true;
             }
 
@@ -105,5 +126,46 @@ pub fn brute_force(grid: &mut Grid) -> bool {
         false
     }
 
-    backtrack(grid, &pairs, 0, &endpoints)
+    let mut visited = CellSet::new(grid.width * grid.height);
+    let mut scratch = Vec::with_capacity(grid.width * grid.height);
+    backtrack(grid, &pairs, 0, &mut visited, &mut scratch)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::utils::grid_from_txt;
+    use std::path::PathBuf;
+
+    fn puzzle(name: &str) -> Grid {
+        grid_from_txt(PathBuf::from(env!("CARGO_MANIFEST_DIR")).join("puzzles").join(name))
+    }
+
+    /// The pair order comes from a `HashMap` and changes between runs, so
+    /// each puzzle is solved several times to exercise different orders.
+    #[test]
+    fn brute_force_reports_solved_boards_only() {
+        let puzzles = [
+            ("regular_5x5_01.txt", true),
+            ("regular_6x6_01.txt", true),
+            ("regular_7x7_01.txt", true),
+            ("regular_8x8_01.txt", true),
+            ("unsolvable_cross.txt", false),
+        ];
+
+        for (name, solvable) in puzzles {
+            for _ in 0..10 {
+                let mut grid = puzzle(name);
+                let solved = brute_force(&mut grid);
+
+                assert_eq!(solved, solvable, "{}\n{}", name, grid);
+                assert_eq!(solved, grid.is_solved(), "{}\n{}", name, grid);
+                if solved {
+                    for &(colour, start, end) in grid.endpoint_pairs() {
+                        assert!(grid.connected(colour, start, end), "{} {:?}\n{}", name, colour, grid);
+                    }
+                }
+            }
+        }
+    }
 }
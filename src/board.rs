@@ -1,5 +1,5 @@
 use colored::Colorize;
-use std::collections::{HashMap, HashSet};
+use std::collections::HashMap;
 use std::fmt;
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
@@ -113,128 +113,293 @@ impl fmt::Display for Cell {
 
 #[derive(Clone, Copy, PartialEq, Eq, Hash, Debug)]
 pub struct Point {
-    pub x: usize,
-    pub y: usize,
+    pub x: u8,
+    pub y: u8,
 }
 
 impl Point {
+    /// Coordinates are stored as bytes, which keeps points (and the paths and
+    /// visited sets built from them) small. Panics on grids wider or taller
+    /// than 256 cells.
     pub fn new(x: usize, y: usize) -> Self {
-        Self { x, y }
+        Self {
+            x: u8::try_from(x).expect("Grid coordinates must fit in a u8"),
+            y: u8::try_from(y).expect("Grid coordinates must fit in a u8"),
+        }
     }
 
-    pub fn neighbors(&self, width: usize, height: usize) -> Vec<Point> {
-        let mut result = Vec::with_capacity(4);
+    /// Yields the in-bounds orthogonal neighbours without allocating; this
+    /// is called for every step of every search.
+    pub fn neighbors(&self, width: usize, height: usize) -> impl Iterator<Item = Point> + use<> {
+        let mut result = [*self; 4];
+        let mut len = 0;
         if self.x > 0 {
-            result.push(Point::new(self.x - 1, self.y));
+            result[len] = Point { x: self.x - 1, y: self.y };
+            len += 1;
         }
-        if self.x + 1 < width {
-            result.push(Point::new(self.x + 1, self.y));
+        if (self.x as usize) + 1 < width {
+            result[len] = Point { x: self.x + 1, y: self.y };
+            len += 1;
         }
         if self.y > 0 {
-            result.push(Point::new(self.x, self.y - 1));
+            result[len] = Point { x: self.x, y: self.y - 1 };
+            len += 1;
         }
-        if self.y + 1 < height {
-            result.push(Point::new(self.x, self.y + 1));
+        if (self.y as usize) + 1 < height {
+            result[len] = Point { x: self.x, y: self.y + 1 };
+            len += 1;
         }
-        result
+        result.into_iter().take(len)
+    }
+}
+
+/// A bitset over a grid's cells, indexed by `Grid::index`. Membership tests
+/// are a shift and a mask instead of hashing a `Point`.
+#[derive(Clone, Debug)]
+pub struct CellSet {
+    words: Vec<u64>,
+}
+
+impl CellSet {
+    pub fn new(len: usize) -> Self {
+        Self {
+            words: vec![0; len.div_ceil(64)],
+        }
+    }
+
+    pub fn contains(&self, idx: usize) -> bool {
+        self.words[idx / 64] & (1 << (idx % 64)) != 0
+    }
+
+    pub fn insert(&mut self, idx: usize) {
+        self.words[idx / 64] |= 1 << (idx % 64);
+    }
+
+    pub fn remove(&mut self, idx: usize) {
+        self.words[idx / 64] &= !(1 << (idx % 64));
     }
 }
 
-#[derive(Clone, PartialEq, Eq)]
+#[derive(Clone)]
 pub struct Grid {
     pub width: usize,
     pub height: usize,
-    pub cells: Vec<Vec<Cell>>,
+    /// Row-major cells, `width * height` long. Private so that every write
+    /// goes through `set`, which keeps `empty` in sync.
+    cells: Vec<Cell>,
+    /// Number of `Cell::Empty` entries in `cells`.
+    empty: usize,
+    /// One `(colour, start, end)` row per colour.
+    pairs: Vec<(Colour, Point, Point)>,
 }
 
 impl Grid {
     pub fn new(width: usize, height: usize, endpoints: &HashMap<Colour, (Point, Point)>) -> Self {
-        let mut cells = vec![vec![Cell::Empty; width]; height];
+        let mut cells = vec![Cell::Empty; width * height];
 
         for (&colour, &(p1, p2)) in endpoints {
-            cells[p1.y][p1.x] = Cell::Endpoint { colour, solved: false };
-            cells[p2.y][p2.x] = Cell::Endpoint { colour, solved: false };
+            cells[p1.y as usize * width + p1.x as usize] = Cell::Endpoint { colour, solved: false };
+            cells[p2.y as usize * width + p2.x as usize] = Cell::Endpoint { colour, solved: false };
         }
 
+        let empty = cells.iter().filter(|cell| matches!(cell, Cell::Empty)).count();
+
+        let pairs = endpoints.iter().map(|(&c, &(s, e))| (c, s, e)).collect();
+
         Self {
             width,
             height,
             cells,
+            empty,
+            pairs,
         }
     }
 
+    pub fn index(&self, point: Point) -> usize {
+        point.y as usize * self.width + point.x as usize
+    }
+
     pub fn get(&self, point: Point) -> Cell {
-        self.cells[point.y][point.x]
+        self.cells[self.index(point)]
     }
 
+    /// Writes a Path or Empty cell. Endpoints are fixed when the grid is
+    /// built, because `pairs` (and so `get_endpoints` and `is_solved`) is
+    /// recorded from them then. Panics on a write that would add, remove or
+    /// recolour an Endpoint.
     pub fn set(&mut self, point: Point, cell: Cell) {
-        self.cells[point.y][point.x] = cell;
+        let idx = self.index(point);
+        match (self.cells[idx], cell) {
+            (Cell::Endpoint { colour: a, .. }, Cell::Endpoint { colour: b, .. }) if a == b => {}
+            (Cell::Endpoint { .. }, _) | (_, Cell::Endpoint { .. }) => {
+                panic!("Endpoints are fixed when the grid is built; cannot set {:?} at {:?}", cell, point)
+            }
+            _ => {}
+        }
+        match (self.cells[idx], cell) {
+            (Cell::Empty, Cell::Empty) => {}
+            (Cell::Empty, _) => self.empty -= 1,
+            (_, Cell::Empty) => self.empty += 1,
+            _ => {}
+        }
+        self.cells[idx] = cell;
     }
 
+    /// Returns the endpoint pairs recorded when the grid was built, rather
+    /// than rescanning the cells for them. `set` refuses to move endpoints,
+    /// so the two cannot drift apart.
     pub fn get_endpoints(&self) -> HashMap<Colour, (Point, Point)> {
-        let mut endpoints: HashMap<Colour, Vec<Point>> = HashMap::new();
+        self.pairs.iter().map(|&(c, s, e)| (c, (s, e))).collect()
+    }
+
+    /// The endpoint table built once in `new`, so per-call loops walk a
+    /// contiguous array instead of a `HashMap`. `fill_guaranteed` takes it as
+    /// a slice because it needs `&mut self` while iterating.
+    pub fn endpoint_pairs(&self) -> &[(Colour, Point, Point)] {
+        &self.pairs
+    }
 
-        for y in 0..self.height {
-            for x in 0..self.width {
-                let p = Point::new(x, y);
-                if let Cell::Endpoint { colour, .. } = self.get(p) {
-                    endpoints.entry(colour).or_default().push(p);
+    pub fn is_full(&self) -> bool {
+        self.empty == 0
+    }
+
+    pub fn is_solved(&self) -> bool {
+        if !self.is_full() {
+            return false;
+        }
+
+        // Label the same-coloured components once and compare the endpoints'
+        // labels, rather than running a separate search for every colour.
+        let labels = self.component_labels();
+        self.pairs.iter().all(|&(_, start, end)| {
+            let label = labels[self.index(start)];
+            label != 0 && label == labels[self.index(end)]
+        })
+    }
+
+    /// Assigns every 4-connected component of same-coloured cells a distinct
+    /// non-zero label. Empty cells keep label 0.
+    fn component_labels(&self) -> Vec<usize> {
+        let mut labels = vec![0; self.cells.len()];
+        let mut stack = Vec::with_capacity(self.cells.len());
+        let mut next = 0;
+
+        let (width, height) = (self.width, self.height);
+
+        for idx in 0..self.cells.len() {
+            if labels[idx] != 0 {
+                continue;
+            }
+            let Some(colour) = self.cells[idx].colour() else {
+                continue;
+            };
+
+            next += 1;
+            labels[idx] = next;
+            let (y, x) = (idx / width, idx % width);
+            stack.push(Point::new(x, y));
+
+            while let Some(current) = stack.pop() {
+                for neighbor in current.neighbors(width, height) {
+                    let n = self.index(neighbor);
+                    if labels[n] == 0 && self.cells[n].colour() == Some(colour) {
+                        labels[n] = next;
+                        stack.push(neighbor);
+                    }
                 }
             }
         }
 
-        endpoints
-            .into_iter()
-            .map(|(colour, points)| {
-                assert!(
-                    points.len() == 2,
-                    "Each colour must have exactly 2 endpoints"
-                );
-                (colour, (points[0], points[1]))
-            })
-            .collect()
+        labels
     }
 
-    pub fn is_solved(&self, endpoints: &HashMap<Colour, (Point, Point)>) -> bool {
-        for row in &self.cells {
-            for cell in row {
-                if let Cell::Empty = cell {
-                    return false;
+    pub fn connected(&self, colour: Colour, start: Point, end: Point) -> bool {
+        if self.cells.is_empty() {
+            // A grid with no cells has no points to search; `chunks` below
+            // would also panic on a zero width.
+            return start == end;
+        }
+        if self.width > 64 {
+            return self.connected_bfs(colour, start, end);
+        }
+
+        // Bit-parallel flood fill: each row of this colour's cells is a u64
+        // mask, and every pass grows the reached set one step in all four
+        // directions with shifts and ORs. Bits past the grid edge are never
+        // set in `mask`, so they cannot leak into `reached`.
+        let mask: Vec<u64> = self
+            .cells
+            .chunks(self.width)
+            .map(|row| {
+                row.iter()
+                    .enumerate()
+                    .filter(|(_, cell)| cell.colour() == Some(colour))
+                    .fold(0, |bits, (x, _)| bits | 1 << x)
+            })
+            .collect();
+
+        let mut reached = vec![0u64; self.height];
+        reached[start.y as usize] = 1 << start.x;
+        let (end_row, end_bit) = (end.y as usize, 1u64 << end.x);
+
+        loop {
+            if reached[end_row] & end_bit != 0 {
+                return true;
+            }
+
+            let mut changed = false;
+            for y in 0..self.height {
+                let row = reached[y];
+                let mut grown = row | row << 1 | row >> 1;
+                if y > 0 {
+                    grown |= reached[y - 1];
+                }
+                if y + 1 < self.height {
+                    grown |= reached[y + 1];
+                }
+                grown = (grown & mask[y]) | row;
+
+                if grown != row {
+                    reached[y] = grown;
+                    changed = true;
                 }
             }
-        }
 
-        for (&colour, &(start, end)) in endpoints {
-            if !self.connected(colour, start, end) {
+            if !changed {
                 return false;
             }
         }
-
-        true
     }
 
-    pub fn connected(&self, colour: Colour, start: Point, end: Point) -> bool {
-        use std::collections::VecDeque;
+    /// Queue-based search used by `connected` for grids too wide for one
+    /// u64 per row.
+    fn connected_bfs(&self, colour: Colour, start: Point, end: Point) -> bool {
+        // Fixed-capacity queue and visited matrix: each cell is enqueued at
+        // most once, so `width * height` slots are always enough.
+        let mut visited = vec![false; self.cells.len()];
+        let mut queue = vec![start; self.cells.len()];
+        let (mut head, mut tail) = (0, 1);
 
-        let mut visited = HashSet::new();
-        let mut queue = VecDeque::new();
+        visited[self.index(start)] = true;
 
-        queue.push_back(start);
-        visited.insert(start);
+        while head < tail {
+            let current = queue[head];
+            head += 1;
 
-        while let Some(current) = queue.pop_front() {
             if current == end {
                 return true;
             }
 
             for neighbor in current.neighbors(self.width, self.height) {
-                if visited.contains(&neighbor) {
+                let idx = self.index(neighbor);
+                if visited[idx] {
                     continue;
                 }
                 match self.get(neighbor) {
                     Cell::Path { colour: c, .. } | Cell::Endpoint { colour: c, .. } if c == colour => {
-                        visited.insert(neighbor);
-                        queue.push_back(neighbor);
+                        visited[idx] = true;
+                        queue[tail] = neighbor;
+                        tail += 1;
                     }
                     _ => {}
                 }
@@ -244,9 +409,10 @@ impl Grid {
         false
     }
 
-    pub fn fill_guaranteed(&mut self, endpoints: &HashMap<Colour, (Point, Point)>) {
+    pub fn fill_guaranteed(&mut self, pairs: &[(Colour, Point, Point)]) {
         fn on_border(p: Point, width: usize, height: usize) -> bool {
-            p.x == 0 || p.x == width - 1 || p.y == 0 || p.y == height - 1
+            let (x, y) = (p.x as usize, p.y as usize);
+            x == 0 || x == width - 1 || y == 0 || y == height - 1
         }
 
         fn is_adjacent_to_solved(grid: &Grid, point: Point) -> bool {
@@ -263,31 +429,36 @@ impl Grid {
             current: Point,
             end: Point,
             colour: Colour,
-            visited: &mut HashSet<Point>,
+            visited: &mut CellSet,
             path: &mut Vec<Point>,
+            limit: usize,
         ) -> Vec<Vec<Point>> {
             if current == end {
                 return vec![path.clone()];
             }
 
             let mut results = vec![];
-            visited.insert(current);
+            visited.insert(grid.index(current));
 
             for neighbor in current.neighbors(grid.width, grid.height) {
-                if visited.contains(&neighbor) {
+                if results.len() >= limit {
+                    break;
+                }
+                if visited.contains(grid.index(neighbor)) {
                     continue;
                 }
 
+                let remaining = limit - results.len();
                 match grid.get(neighbor) {
                     Cell::Empty => {
                         path.push(neighbor);
-                        let subpaths = find_all_paths(grid, neighbor, end, colour, visited, path);
+                        let subpaths = find_all_paths(grid, neighbor, end, colour, visited, path, remaining);
                         results.extend(subpaths);
                         path.pop();
                     }
                     Cell::Path { colour: c, .. } | Cell::Endpoint { colour: c, .. } if c == colour => {
                         path.push(neighbor);
-                        let subpaths = find_all_paths(grid, neighbor, end, colour, visited, path);
+                        let subpaths = find_all_paths(grid, neighbor, end, colour, visited, path, remaining);
                         results.extend(subpaths);
                         path.pop();
                     }
@@ -295,7 +466,7 @@ impl Grid {
                 }
             }
 
-            visited.remove(&current);
+            visited.remove(grid.index(current));
             results
         }
 
@@ -310,10 +481,10 @@ impl Grid {
             // First try the restricted approach (border + adjacent to solved)
             let mut queue = VecDeque::new();
             let mut came_from = HashMap::new();
-            let mut visited = HashSet::new();
+            let mut visited = CellSet::new(grid.cells.len());
 
             queue.push_back(start);
-            visited.insert(start);
+            visited.insert(grid.index(start));
 
             while let Some(current) = queue.pop_front() {
                 if current == end {
@@ -329,7 +500,7 @@ impl Grid {
                 }
 
                 for neighbor in current.neighbors(grid.width, grid.height) {
-                    if visited.contains(&neighbor) {
+                    if visited.contains(grid.index(neighbor)) {
                         continue;
                     }
 
@@ -343,12 +514,12 @@ impl Grid {
 
                     match grid.get(neighbor) {
                         Cell::Empty => {
-                            visited.insert(neighbor);
+                            visited.insert(grid.index(neighbor));
                             came_from.insert(neighbor, current);
                             queue.push_back(neighbor);
                         }
                         Cell::Path { colour: c, .. } | Cell::Endpoint { colour: c, .. } if c == colour => {
-                            visited.insert(neighbor);
+                            visited.insert(grid.index(neighbor));
                             came_from.insert(neighbor, current);
                             queue.push_back(neighbor);
                         }
@@ -358,10 +529,11 @@ impl Grid {
             }
 
             // If restricted approach failed, try finding all possible paths
-            // If there's exactly one path, it's guaranteed
-            let mut all_visited = HashSet::new();
+            // If there's exactly one path, it's guaranteed. Finding a second
+            // path already rules that out, so stop searching there.
+            let mut all_visited = CellSet::new(grid.cells.len());
             let mut path = vec![start];
-            let all_paths = find_all_paths(grid, start, end, colour, &mut all_visited, &mut path);
+            let all_paths = find_all_paths(grid, start, end, colour, &mut all_visited, &mut path, 2);
             
             if all_paths.len() == 1 {
                 return Some(all_paths.into_iter().next().unwrap());
@@ -374,7 +546,7 @@ impl Grid {
             let mut updates: Vec<(Point, Cell)> = Vec::new();
             let mut solved_colours: Vec<Colour> = Vec::new();
 
-            for (&colour, &(start, end)) in endpoints {
+            for &(colour, start, end) in pairs {
                 if self.connected(colour, start, end) {
                     continue;
                 }
@@ -420,26 +592,31 @@ impl Grid {
     }
 
     pub fn mark_solved(&mut self, colour: Colour) {
-        for y in 0..self.height {
-            for x in 0..self.width {
-                let point = Point::new(x, y);
-                match self.get(point) {
-                    Cell::Endpoint { colour: c, .. } if c == colour => {
-                        self.set(point, Cell::Endpoint { colour, solved: true });
-                    }
-                    Cell::Path { colour: c, .. } if c == colour => {
-                        self.set(point, Cell::Path { colour, solved: true });
-                    }
-                    _ => {}
-                }
+        // Marking never changes whether a cell is empty, so the cells can be
+        // updated in place without going through `set`.
+        for cell in self.cells.iter_mut() {
+            if cell.colour() == Some(colour) {
+                *cell = cell.mark_solved();
             }
         }
     }
 }
 
+// `pairs` is collected from a `HashMap`, so its order differs between
+// otherwise identical grids; it is also fully determined by the endpoint
+// cells. Compare the board itself.
+impl PartialEq for Grid {
+    fn eq(&self, other: &Self) -> bool {
+        self.width == other.width && self.height == other.height && self.cells == other.cells
+    }
+}
+
+impl Eq for Grid {}
+
 impl fmt::Display for Grid {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        for row in &self.cells {
+        // `chunks` panics on 0, which an empty puzzle file produces.
+        for row in self.cells.chunks(self.width.max(1)) {
             for cell in row {
                 write!(f, "{} ", cell)?;
             }
@@ -448,3 +625,191 @@ impl fmt::Display for Grid {
         Ok(())
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Deterministic xorshift so failures reproduce without a rand crate.
+    struct Rng(u64);
+
+    impl Rng {
+        fn below(&mut self, n: usize) -> usize {
+            self.0 ^= self.0 << 13;
+            self.0 ^= self.0 >> 7;
+            self.0 ^= self.0 << 17;
+            (self.0 % n as u64) as usize
+        }
+    }
+
+    fn random_grid(rng: &mut Rng, width: usize, height: usize) -> (Grid, Point, Point) {
+        // Vary how much of the grid is red, so that some grids have long runs
+        // reaching both edges and some are fragmented.
+        let density = rng.below(10) + 1;
+        let start = Point::new(rng.below(width), rng.below(height));
+        let end = Point::new(rng.below(width), rng.below(height));
+        let endpoints: HashMap<_, _> = [(Colour::Red, (start, end))].into_iter().collect();
+        let mut grid = Grid::new(width, height, &endpoints);
+        for y in 0..height {
+            for x in 0..width {
+                let point = Point::new(x, y);
+                if point == start || point == end {
+                    continue;
+                }
+                let cell = if rng.below(10) < density {
+                    Cell::Path { colour: Colour::Red, solved: false }
+                } else if rng.below(2) == 0 {
+                    Cell::Empty
+                } else {
+                    Cell::Path { colour: Colour::Blue, solved: false }
+                };
+                grid.set(point, cell);
+            }
+        }
+
+        (grid, start, end)
+    }
+
+    #[test]
+    fn connected_matches_bfs() {
+        let mut rng = Rng(0x5eed_f10a);
+        let mut shapes = vec![(64, 1), (64, 5), (64, 64), (1, 1), (1, 64), (63, 3)];
+        for n in 1..=64 {
+            shapes.push((n, 1));
+            shapes.push((1, n));
+        }
+        for _ in 0..5000 {
+            shapes.push((rng.below(64) + 1, rng.below(16) + 1));
+        }
+
+        for (width, height) in shapes {
+            for _ in 0..4 {
+                let (grid, start, end) = random_grid(&mut rng, width, height);
+                assert_eq!(
+                    grid.connected(Colour::Red, start, end),
+                    grid.connected_bfs(Colour::Red, start, end),
+                    "{}x{} grid, {:?} -> {:?}\n{}",
+                    width,
+                    height,
+                    start,
+                    end,
+                    grid
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn grids_from_equal_endpoints_are_equal() {
+        let endpoints: HashMap<_, _> = [
+            (Colour::Red, (Point::new(0, 0), Point::new(4, 0))),
+            (Colour::Green, (Point::new(0, 1), Point::new(4, 1))),
+            (Colour::Blue, (Point::new(1, 0), Point::new(3, 0))),
+            (Colour::Yellow, (Point::new(1, 1), Point::new(3, 1))),
+        ]
+        .into_iter()
+        .collect();
+        let grid = Grid::new(5, 2, &endpoints);
+        for _ in 0..50 {
+            let copy: HashMap<_, _> = endpoints.iter().map(|(&c, &p)| (c, p)).collect();
+            assert!(Grid::new(5, 2, &copy) == grid);
+        }
+    }
+
+    /// 3x2 grid with Red endpoints on the top row and Blue on the bottom,
+    /// and the two middle cells set to `top` and `bottom`.
+    fn two_pair_grid(top: Cell, bottom: Cell) -> Grid {
+        let endpoints: HashMap<_, _> = [
+            (Colour::Red, (Point::new(0, 0), Point::new(2, 0))),
+            (Colour::Blue, (Point::new(0, 1), Point::new(2, 1))),
+        ]
+        .into_iter()
+        .collect();
+        let mut grid = Grid::new(3, 2, &endpoints);
+        grid.set(Point::new(1, 0), top);
+        grid.set(Point::new(1, 1), bottom);
+        grid
+    }
+
+    #[test]
+    fn is_solved_when_full_and_connected() {
+        let grid = two_pair_grid(
+            Cell::Path { colour: Colour::Red, solved: false },
+            Cell::Path { colour: Colour::Blue, solved: false },
+        );
+        assert!(grid.is_solved());
+    }
+
+    #[test]
+    fn is_not_solved_when_full_but_disconnected() {
+        let grid = two_pair_grid(
+            Cell::Path { colour: Colour::Blue, solved: false },
+            Cell::Path { colour: Colour::Red, solved: false },
+        );
+        assert!(grid.is_full());
+        assert!(!grid.is_solved());
+    }
+
+    #[test]
+    fn is_not_solved_when_not_full() {
+        let grid = two_pair_grid(Cell::Path { colour: Colour::Red, solved: false }, Cell::Empty);
+        assert!(!grid.is_solved());
+    }
+
+    #[test]
+    fn empty_count_tracks_set_and_mark_solved() {
+        fn scanned(grid: &Grid) -> usize {
+            grid.cells.iter().filter(|cell| matches!(cell, Cell::Empty)).count()
+        }
+
+        let endpoints: HashMap<_, _> =
+            [(Colour::Red, (Point::new(0, 0), Point::new(2, 0)))].into_iter().collect();
+        let mut grid = Grid::new(3, 1, &endpoints);
+        let middle = Point::new(1, 0);
+        assert_eq!((grid.empty, scanned(&grid)), (1, 1));
+        assert!(!grid.is_full());
+
+        grid.set(middle, Cell::Path { colour: Colour::Red, solved: false });
+        assert_eq!((grid.empty, scanned(&grid)), (0, 0));
+        assert!(grid.is_full());
+
+        grid.set(middle, Cell::Path { colour: Colour::Blue, solved: false });
+        assert_eq!((grid.empty, scanned(&grid)), (0, 0));
+
+        grid.set(middle, Cell::Empty);
+        assert_eq!((grid.empty, scanned(&grid)), (1, 1));
+        assert!(!grid.is_full());
+
+        grid.set(middle, Cell::Empty);
+        assert_eq!((grid.empty, scanned(&grid)), (1, 1));
+
+        grid.set(middle, Cell::Path { colour: Colour::Red, solved: false });
+        grid.mark_solved(Colour::Red);
+        assert_eq!(grid.get(middle), Cell::Path { colour: Colour::Red, solved: true });
+        assert_eq!((grid.empty, scanned(&grid)), (0, 0));
+        assert!(grid.is_full());
+    }
+
+    #[test]
+    #[should_panic(expected = "Endpoints are fixed")]
+    fn set_rejects_new_endpoints() {
+        let mut grid = Grid::new(2, 1, &HashMap::new());
+        grid.set(Point::new(0, 0), Cell::Endpoint { colour: Colour::Red, solved: false });
+    }
+
+    #[test]
+    #[should_panic(expected = "Endpoints are fixed")]
+    fn set_rejects_overwriting_endpoints() {
+        let endpoints: HashMap<_, _> =
+            [(Colour::Red, (Point::new(0, 0), Point::new(1, 0)))].into_iter().collect();
+        let mut grid = Grid::new(2, 1, &endpoints);
+        grid.set(Point::new(0, 0), Cell::Empty);
+    }
+
+    #[test]
+    fn connected_on_empty_grid() {
+        let grid = Grid::new(0, 0, &HashMap::new());
+        let origin = Point::new(0, 0);
+        assert!(grid.connected(Colour::Red, origin, origin));
+    }
+}
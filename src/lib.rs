@@ -2,4 +2,4 @@ pub mod backtracking;
 pub mod board;
 pub mod utils;
 pub mod solver;
-pub use board::{Cell, Colour, Grid, Point};
+pub use board::{Cell, CellSet, Colour, Grid, Point};
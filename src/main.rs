@@ -1,7 +1,11 @@
 use flowrs::backtracking::brute_force;
 use flowrs::utils::{duration, grid_from_txt};
 use flowrs::board::{Grid};
+use std::env;
 use std::path::PathBuf;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::thread;
+use std::time::Duration;
 
 fn main() {
     let grids: Vec<Grid> = vec!(
@@ -10,14 +14,49 @@ fn main() {
         grid_from_txt(PathBuf::from("puzzles/regular_7x7_01.txt"))
     );
 
-    for mut grid in grids {
-        println!("{}", grid);
+    // The puzzles are independent, so solve them on as many threads as there
+    // are cores. Workers pull the next unsolved index from a shared counter.
+    // FLOWRS_THREADS overrides the count, e.g. FLOWRS_THREADS=1 so that each
+    // timing is taken without other solves competing for the CPU.
+    let workers = env::var("FLOWRS_THREADS")
+        .ok()
+        .and_then(|n| n.parse::<usize>().ok())
+        .filter(|&n| n > 0)
+        .unwrap_or_else(|| thread::available_parallelism().map_or(1, |n| n.get()))
+        .min(grids.len());
+    let next = AtomicUsize::new(0);
 
-        let dur = duration(|| {
-            brute_force(&mut grid);
-        });
-        println!("Solver: {:.2?}", dur);
+    let mut solved: Vec<(usize, Grid, Duration)> = thread::scope(|s| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| {
+                s.spawn(|| {
+                    let mut results = vec![];
+                    loop {
+                        let i = next.fetch_add(1, Ordering::Relaxed);
+                        let Some(grid) = grids.get(i) else {
+                            break;
+                        };
+                        let mut grid = grid.clone();
+                        let dur = duration(|| {
+                            brute_force(&mut grid);
+                        });
+                        results.push((i, grid, dur));
+                    }
+                    results
+                })
+            })
+            .collect();
+
+        handles
+            .into_iter()
+            .flat_map(|h| h.join().expect("Solver thread panicked"))
+            .collect()
+    });
+    solved.sort_by_key(|&(i, ..)| i);
 
+    for (i, grid, dur) in solved {
+        println!("{}", grids[i]);
+        println!("Solver: {:.2?}", dur);
         println!("{}", grid)
     }
 }
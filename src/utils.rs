@@ -1,7 +1,6 @@
 use crate::*;
 use std::collections::HashMap;
-use std::fs::File;
-use std::io::{BufRead, BufReader};
+use std::fs;
 use std::path::PathBuf;
 use std::time::Instant;
 
@@ -15,21 +14,21 @@ where
 }
 
 pub fn grid_from_txt(path: PathBuf) -> Grid {
-    let file = File::open(path).expect("Failed to open file");
-    let reader = BufReader::new(file);
+    // Read the whole puzzle in one go and walk its bytes, instead of
+    // allocating a String per line.
+    let text = fs::read_to_string(path).expect("Failed to open file");
 
     let mut endpoints: HashMap<Colour, Vec<Point>> = HashMap::new();
     let mut width = 0;
     let mut height = 0;
 
-    for (y, line) in reader.lines().enumerate() {
-        let line = line.expect("Failed to read line");
-        width = line.len().max(width); 
+    for (y, line) in text.lines().enumerate() {
+        width = line.len().max(width);
 
-        for (x, ch) in line.chars().enumerate() {
+        for (x, ch) in line.bytes().enumerate() {
             if ch.is_ascii_alphabetic() {
-                let colour = Colour::from_char(ch);
-                endpoints.entry(colour).or_default().push(Point { x, y });
+                let colour = Colour::from_char(ch as char);
+                endpoints.entry(colour).or_default().push(Point::new(x, y));
             }
         }
 